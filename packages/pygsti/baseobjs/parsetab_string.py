@@ -0,0 +1,58 @@
+
+# parsetab_string.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ppstringCLOSEBR COLON EXCLAM EXPOP GATE INSTRMT INTEGER LPAREN MULTOP NOP OPENBR POVM PREP REFLBL RPAREN SEMICOLON STRINGINDstrref  : STRINGIND REFLBLslcref : strref OPENBR INTEGER COLON INTEGER CLOSEBRslcref : strrefsubcircuit : OPENBR layer CLOSEBRsubcircuit : LPAREN layer RPARENlayerable : GATE\n                     | INSTRMT layerable : subcircuit layerable : subcircuit EXPOP INTEGERlayer : layerablelayer : layer layerablelayer : layer MULTOP layerableexpable : LPAREN string RPARENexpable : OPENBR layer CLOSEBRexpable : OPENBR CLOSEBRexpable : GATE\n                   | INSTRMT\n                   | NOP expable : slcrefexpdstr : expable EXPOP INTEGERexpdstr : expablestring : expdstrstring : string expdstrstring : string MULTOP expdstrpstring : stringpstring : PREP stringppstring : pstringppstring : pstring POVM'
+    
+_lr_action_items = {'PREP':([0,],[4,]),'LPAREN':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,37,39,41,42,43,44,47,],[7,7,7,-22,-21,7,28,-16,-17,-18,-19,-3,-23,7,7,7,28,28,-15,-10,-6,-7,-8,28,-1,-24,-20,-13,28,-14,-11,28,28,-4,-12,-9,-5,-2,]),'OPENBR':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,37,39,41,42,43,44,47,],[8,8,8,-22,-21,8,21,-16,-17,-18,-19,29,-23,8,8,8,21,21,-15,-10,-6,-7,-8,21,-1,-24,-20,-13,21,-14,-11,21,21,-4,-12,-9,-5,-2,]),'GATE':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,37,39,41,42,43,44,47,],[9,9,9,-22,-21,9,25,-16,-17,-18,-19,-3,-23,9,9,9,25,25,-15,-10,-6,-7,-8,25,-1,-24,-20,-13,25,-14,-11,25,25,-4,-12,-9,-5,-2,]),'INSTRMT':([0,3,4,5,6,7,8,9,10,11,12,13,16,17,18,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,37,39,41,42,43,44,47,],[10,10,10,-22,-21,10,26,-16,-17,-18,-19,-3,-23,10,10,10,26,26,-15,-10,-6,-7,-8,26,-1,-24,-20,-13,26,-14,-11,26,26,-4,-12,-9,-5,-2,]),'NOP':([0,3,4,5,6,7,9,10,11,12,13,16,17,18,20,23,30,31,32,33,35,47,],[11,11,11,-22,-21,11,-16,-17,-18,-19,-3,-23,11,11,11,-15,-1,-24,-20,-13,-14,-2,]),'STRINGIND':([0,3,4,5,6,7,9,10,11,12,13,16,17,18,20,23,30,31,32,33,35,47,],[14,14,14,-22,-21,14,-16,-17,-18,-19,-3,-23,14,14,14,-15,-1,-24,-20,-13,-14,-2,]),'$end':([1,2,3,5,6,9,10,11,12,13,15,16,18,23,30,31,32,33,35,47,],[0,-27,-25,-22,-21,-16,-17,-18,-19,-3,-28,-23,-26,-15,-1,-24,-20,-13,-14,-2,]),'POVM':([2,3,5,6,9,10,11,12,13,16,18,23,30,31,32,33,35,47,],[15,-25,-22,-21,-16,-17,-18,-19,-3,-23,-26,-15,-1,-24,-20,-13,-14,-2,]),'MULTOP':([3,5,6,9,10,11,12,13,16,18,20,22,23,24,25,26,27,30,31,32,33,34,35,36,39,41,42,43,44,47,],[17,-22,-21,-16,-17,-18,-19,-3,-23,17,17,37,-15,-10,-6,-7,-8,-1,-24,-20,-13,37,-14,-11,37,-4,-12,-9,-5,-2,]),'RPAREN':([5,6,9,10,11,12,13,16,20,23,24,25,26,27,30,31,32,33,35,36,39,41,42,43,44,47,],[-22,-21,-16,-17,-18,-19,-3,-23,33,-15,-10,-6,-7,-8,-1,-24,-20,-13,-14,-11,44,-4,-12,-9,-5,-2,]),'EXPOP':([6,9,10,11,12,13,23,27,30,33,35,41,44,47,],[19,-16,-17,-18,-19,-3,-15,38,-1,-13,-14,-4,-5,-2,]),'CLOSEBR':([8,22,24,25,26,27,34,36,41,42,43,44,46,],[23,35,-10,-6,-7,-8,41,-11,-4,-12,-9,-5,47,]),'REFLBL':([14,],[30,]),'INTEGER':([19,29,38,45,],[32,40,43,46,]),'COLON':([40,],[45,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'ppstring':([0,],[1,]),'pstring':([0,],[2,]),'string':([0,4,7,],[3,18,20,]),'expdstr':([0,3,4,7,17,18,20,],[5,16,5,5,31,16,16,]),'expable':([0,3,4,7,17,18,20,],[6,6,6,6,6,6,6,]),'slcref':([0,3,4,7,17,18,20,],[12,12,12,12,12,12,12,]),'strref':([0,3,4,7,17,18,20,],[13,13,13,13,13,13,13,]),'layer':([8,21,28,],[22,34,39,]),'layerable':([8,21,22,28,34,37,39,],[24,24,36,24,36,42,36,]),'subcircuit':([8,21,22,28,34,37,39,],[27,27,27,27,27,27,27,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> ppstring","S'",1,None,None,None),
+  ('strref -> STRINGIND REFLBL','strref',2,'p_strref','circuitparser.py',197),
+  ('slcref -> strref OPENBR INTEGER COLON INTEGER CLOSEBR','slcref',6,'p_slcref_slice','circuitparser.py',204),
+  ('slcref -> strref','slcref',1,'p_slcref','circuitparser.py',210),
+  ('subcircuit -> OPENBR layer CLOSEBR','subcircuit',3,'p_subcircuit_singlelayer','circuitparser.py',215),
+  ('subcircuit -> LPAREN layer RPAREN','subcircuit',3,'p_subcircuit_string','circuitparser.py',220),
+  ('layerable -> GATE','layerable',1,'p_layerable','circuitparser.py',225),
+  ('layerable -> INSTRMT','layerable',1,'p_layerable','circuitparser.py',226),
+  ('layerable -> subcircuit','layerable',1,'p_layerable_subcircuit','circuitparser.py',231),
+  ('layerable -> subcircuit EXPOP INTEGER','layerable',3,'p_layerable_subcircuit_expop','circuitparser.py',237),
+  ('layer -> layerable','layer',1,'p_layer_layerable','circuitparser.py',243),
+  ('layer -> layer layerable','layer',2,'p_layer_str','circuitparser.py',248),
+  ('layer -> layer MULTOP layerable','layer',3,'p_layer','circuitparser.py',253),
+  ('expable -> LPAREN string RPAREN','expable',3,'p_expable_paren','circuitparser.py',258),
+  ('expable -> OPENBR layer CLOSEBR','expable',3,'p_expable_layer','circuitparser.py',263),
+  ('expable -> OPENBR CLOSEBR','expable',2,'p_expable_empty_layer','circuitparser.py',268),
+  ('expable -> GATE','expable',1,'p_expable_single','circuitparser.py',273),
+  ('expable -> INSTRMT','expable',1,'p_expable_single','circuitparser.py',274),
+  ('expable -> NOP','expable',1,'p_expable_single','circuitparser.py',275),
+  ('expable -> slcref','expable',1,'p_expable','circuitparser.py',280),
+  ('expdstr -> expable EXPOP INTEGER','expdstr',3,'p_expdstr_expop','circuitparser.py',285),
+  ('expdstr -> expable','expdstr',1,'p_expdstr','circuitparser.py',295),
+  ('string -> expdstr','string',1,'p_string_expdstr','circuitparser.py',300),
+  ('string -> string expdstr','string',2,'p_string_str','circuitparser.py',305),
+  ('string -> string MULTOP expdstr','string',3,'p_string','circuitparser.py',310),
+  ('pstring -> string','pstring',1,'p_pstring','circuitparser.py',315),
+  ('pstring -> PREP string','pstring',2,'p_pstring_prep','circuitparser.py',320),
+  ('ppstring -> pstring','ppstring',1,'p_ppstring','circuitparser.py',325),
+  ('ppstring -> pstring POVM','ppstring',2,'p_ppstring_povm','circuitparser.py',330),
+]
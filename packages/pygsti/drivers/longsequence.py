@@ -992,9 +992,9 @@ def do_stdpractice_gst(dataFilenameOrSet, targetModelFilenameOrObj,
     if output_pkl and (comm is None or comm.Get_rank() == 0):
         if _compat.isstr(output_pkl):
             with open(output_pkl, 'wb') as pklfile:
-                _pickle.dump(ret, pklfile)
+                _pickle.dump(ret, pklfile, protocol=_pickle.HIGHEST_PROTOCOL)
         else:
-            _pickle.dump(ret, output_pkl)
+            _pickle.dump(ret, output_pkl, protocol=_pickle.HIGHEST_PROTOCOL)
 
     return ret
 
@@ -1613,8 +1613,8 @@ def _post_opt_processing(callerName, ds, target_model, mdl_start, lsgstLists,
     if output_pkl and (comm is None or comm.Get_rank() == 0):
         if _compat.isstr(output_pkl):
             with open(output_pkl, 'wb') as pklfile:
-                _pickle.dump(ret, pklfile)
+                _pickle.dump(ret, pklfile, protocol=_pickle.HIGHEST_PROTOCOL)
         else:
-            _pickle.dump(ret, output_pkl)
+            _pickle.dump(ret, output_pkl, protocol=_pickle.HIGHEST_PROTOCOL)
 
     return ret
@@ -216,6 +216,7 @@ def enable_old_object_unpickling(old_version="0.9.6"):
         #_baseobjs.basis.saved_Basis = _baseobjs.basis.Basis
         #_baseobjs.basis.Basis = dummy_Basis
         _baseobjs.basis.Basis.__setstate__ = Basis_setstate
+        _objs.circuit.Circuit.saved_setstate = _objs.circuit.Circuit.__setstate__
         _objs.circuit.Circuit.__setstate__ = Circuit_setstate
         _objs.labeldicts.StateSpaceLabels.__setstate__ = StateSpaceLabels_setstate
         _objs.circuit.CompressedCircuit.saved_expand = _objs.circuit.CompressedCircuit.expand
@@ -238,7 +239,6 @@ def enable_old_object_unpickling(old_version="0.9.6"):
 
         del _sys.modules['pygsti.objects.povm'].LindbladParameterizedPOVM
 
-        delattr(_objs.Circuit, '__setstate__')
         delattr(_objs.LindbladDenseOp, '__setstate__')
         #delattr(_baseobjs.Dim,'__setstate__')
         delattr(_objs.modelmember.ModelMember, '__setstate__')
@@ -250,7 +250,7 @@ def enable_old_object_unpickling(old_version="0.9.6"):
         del _sys.modules['pygsti.baseobjs.dim']
         delattr(_baseobjs.Basis, '__setstate__')
         delattr(_objs.labeldicts.StateSpaceLabels, '__setstate__')
-        if hasattr(_objs.Circuit, '__setstate__'):  # b/c above block may have already deleted this
-            delattr(_objs.Circuit, '__setstate__')
+        _objs.circuit.Circuit.__setstate__ = _objs.circuit.Circuit.saved_setstate  # restore, don't delete
+        delattr(_objs.circuit.Circuit, 'saved_setstate')
         _objs.circuit.CompressedCircuit.expand = _objs.circuit.CompressedCircuit.saved_expand
         delattr(_objs.circuit.CompressedCircuit, 'saved_expand')
@@ -87,6 +87,11 @@ def _accumulate_explicit_sslbls(obj):
     return ret
 
 
+def _copy_nested_lists(obj):
+    """ Copy the list structure of nested lists of (immutable) simple labels. """
+    return [_copy_nested_lists(el) for el in obj] if isinstance(obj, list) else obj
+
+
 def _opSeqToStr(seq, line_labels):
     """ Used for creating default string representations. """
     if len(seq) == 0: return "{}"  # special case of empty operation sequence
@@ -100,6 +105,16 @@ def _opSeqToStr(seq, line_labels):
             + "@(" + ','.join(map(str, line_labels)) + ")"
 
 
+#Qcircuit LaTeX for one line's cell of a 2-qubit gate, keyed by gate name.  Cell functions take
+# the line indices of the gate's first (control) and second qubits and the index of the line being drawn.
+def _qcircuit_ctrl_targ_cell(i0, i1, k): return (' \\ctrl{%d} &' % (i1 - k)) if k == i0 else ' \\targ &'
+def _qcircuit_ctrl_ctrl_cell(i0, i1, k): return (' \\ctrl{%d} &' % (i1 - k)) if k == i0 else ' \\control \\qw &'
+
+
+_QCIRCUIT_2Q_CELLS = {'CNOT': _qcircuit_ctrl_targ_cell, 'Gcnot': _qcircuit_ctrl_targ_cell,
+                      'CPHASE': _qcircuit_ctrl_ctrl_cell, 'Gcphase': _qcircuit_ctrl_ctrl_cell}
+
+
 def toLabel(x):
     """ Helper function for converting `x` to a single Label object """
     if isinstance(x, _Label): return x
@@ -299,6 +314,9 @@ class Circuit(object):
         #self._reps = reps # repetitions: default=1, which remains unless we initialize from a CircuitLabel...
         self._name = name  # can be None
         self._str = stringrep if self._static else None  # can be None (lazy generation)
+        self._depth = None  # cached depth (lazy generation; only cached when read-only)
+        self._hash = None  # cached hash of self._labels (only used when read-only)
+        self._compressed_sig = None  # layers & relations known to be unchanged by compress_depth
         self._times = None  # for FUTURE expansion
         self.auxinfo = {}  # for FUTURE expansion / user metadata
 
@@ -417,7 +435,20 @@ class Circuit(object):
                             " mode in order to hash it.  You should call"
                             " circuit.done_editing() beforehand."))
             self.done_editing()
-        return hash(self._labels)  # just hash the tuple of labels
+        if self._hash is None:
+            self._hash = hash(self._labels)  # just hash the tuple of labels
+        return self._hash
+
+    def __getstate__(self):
+        state_dict = self.__dict__.copy()
+        state_dict['_hash'] = None  # string hashes (and so label hashes) can change between processes
+        state_dict['_compressed_sig'] = None  # don't pickle the (reference to) oneQgate_relations
+        return state_dict
+
+    def __setstate__(self, state_dict):
+        self.__dict__.update(state_dict)
+        for k in ('_depth', '_hash', '_compressed_sig'):  # backward compatibility
+            if k not in state_dict: setattr(self, k, None)
 
     def __len__(self):
         return len(self._labels)
@@ -508,7 +539,30 @@ class Circuit(object):
         Circuit
         """
         if editable == "auto": editable = not self._static
-        return Circuit(self.tup, self.line_labels, None, editable, self._str, check=False)
+
+        #Build the copy structurally instead of going through __init__ (which re-parses
+        # and re-checks the layer labels).  Label objects are immutable, so they (and
+        # a static circuit's tuple of them) can be shared; only lists need copying.
+        cpy = Circuit.__new__(Circuit)
+        if editable:
+            if self._static:
+                cpy._labels = [_label_to_nested_lists_of_simple_labels(layer_lbl) for layer_lbl in self._labels]
+            else:
+                cpy._labels = _copy_nested_lists(self._labels)
+        else:
+            cpy._labels = self._labels if self._static else \
+                tuple([_Label(layer_lbl) for layer_lbl in self._labels])
+
+        cpy._line_labels = self._line_labels
+        cpy._static = not editable
+        cpy._name = self._name
+        cpy._str = self._str if cpy._static else None
+        cpy._depth = self._depth if (self._static and cpy._static) else None
+        cpy._hash = self._hash if (self._static and cpy._static) else None
+        cpy._compressed_sig = None
+        cpy._times = self._times
+        cpy.auxinfo = self.auxinfo.copy()
+        return cpy
 
     def clear(self):
         """
@@ -1854,6 +1908,21 @@ class Circuit(object):
         assert(set(order) == set(self.line_labels)), "The line labels must be the same!"
         self._line_labels = tuple(order)
 
+    def _used_sslbls(self, idle_layer_labels=None):
+        """
+        The set of line labels used by the non-idle layers of this circuit, or
+        `None` if any such layer acts on *all* the lines.
+        """
+        if not self._static:
+            return _sslbls_of_nested_lists_of_simple_labels(self._labels, idle_layer_labels)  # None or a set
+
+        used_sslbls = set()
+        for layer in self._labels:
+            if idle_layer_labels and layer in idle_layer_labels: continue
+            if layer.sslbls is None: return None  # no lines are idling, so no need to look further
+            used_sslbls.update(layer.sslbls)
+        return used_sslbls
+
     def is_line_idling(self, line_label, idle_layer_labels=None):
         """
         Whether the line in question is idling in *every* circuit layer.
@@ -1874,13 +1943,7 @@ class Circuit(object):
         bool
             True if the line is idling. False otherwise.
         """
-        if self._static:
-            layers = list(filter(lambda x: x not in idle_layer_labels, self._labels)) \
-                if idle_layer_labels else self._labels
-            all_sslbls = None if any([layer.sslbls is None for layer in layers]) \
-                else set(_itertools.chain(*[layer.sslbls for layer in layers]))
-        else:
-            all_sslbls = _sslbls_of_nested_lists_of_simple_labels(self._labels, idle_layer_labels)  # None or a set
+        all_sslbls = self._used_sslbls(idle_layer_labels)  # None or a set
 
         if all_sslbls is None:
             return False  # no lines are idling
@@ -1902,13 +1965,7 @@ class Circuit(object):
         -------
         tuple
         """
-        if self._static:
-            layers = list(filter(lambda x: x not in idle_layer_labels, self._labels)) \
-                if idle_layer_labels else self._labels
-            all_sslbls = None if any([layer.sslbls is None for layer in layers]) \
-                else set(_itertools.chain(*[layer.sslbls for layer in layers]))
-        else:
-            all_sslbls = _sslbls_of_nested_lists_of_simple_labels(self._labels, idle_layer_labels)  # None or a set
+        all_sslbls = self._used_sslbls(idle_layer_labels)  # None or a set
 
         if all_sslbls is None:
             return ()
@@ -1938,13 +1995,7 @@ class Circuit(object):
         if idle_layer_labels:
             assert(all([toLabel(x).sslbls is None for x in idle_layer_labels])), "Idle layer labels must be *global*"
 
-        if self._static:
-            layers = list(filter(lambda x: x not in idle_layer_labels, self._labels)) \
-                if idle_layer_labels else self._labels
-            all_sslbls = None if any([layer.sslbls is None for layer in layers]) \
-                else set(_itertools.chain(*[layer.sslbls for layer in layers]))
-        else:
-            all_sslbls = _sslbls_of_nested_lists_of_simple_labels(self._labels, idle_layer_labels)  # None or a set
+        all_sslbls = self._used_sslbls(idle_layer_labels)  # None or a set
 
         if all_sslbls is None:
             return  # no lines are idling
@@ -2026,13 +2077,20 @@ class Circuit(object):
         # A flag telling us when to stop iterating
         productive = True
 
+        # Local references for the loops below (the list of layers is only ever modified in place)
+        labels = self._labels
+        layer_components = self._layer_components
+        append_layer_component = self._append_layer_component
+        replace_layer_component = self._replace_layer_component
+        remove_layer_component = self._remove_layer_component
+
         while productive:  # keep iterating
             #print("BEGIN ITER")
             productive = False
             # Loop through all the qubits, to try and compress squences of 1-qubit gates on the qubit in question.
-            for ilayer in range(0, len(self._labels) - 1):
-                layerA_comps = self._layer_components(ilayer)
-                layerB_comps = self._layer_components(ilayer + 1)
+            for ilayer in range(0, len(labels) - 1):
+                layerA_comps = layer_components(ilayer)
+                layerB_comps = layer_components(ilayer + 1)
                 applies = []
                 for a, lblA in enumerate(layerA_comps):
                     if not isinstance(lblA, _Label) or (lblA.sslbls is None) \
@@ -2048,7 +2106,7 @@ class Circuit(object):
                                 applies.append((a, b, new_Aname, lblA.sslbls))
                                 break
 
-                layerA_sslbls = _sslbls_of_nested_lists_of_simple_labels(self._labels[ilayer])
+                layerA_sslbls = _sslbls_of_nested_lists_of_simple_labels(labels[ilayer])
                 for b, lblB in enumerate(layerB_comps):
                     if isinstance(lblB, _Label):
                         #see if layerA happens to *not* have anything on lblB.sslbls:
@@ -2066,15 +2124,15 @@ class Circuit(object):
                 ilayer_inds_to_remove = []
                 for a, b, new_Aname, sslbls in sorted_applies:
                     if a == -1:  # Note: new_Aname cannot be None here
-                        self._append_layer_component(ilayer, _Label(new_Aname, sslbls))
+                        append_layer_component(ilayer, _Label(new_Aname, sslbls))
                     elif new_Aname is None:
                         ilayer_inds_to_remove.append(a)  # remove layer component - but wait to do so in order
                     else:
-                        self._replace_layer_component(ilayer, a, _Label(new_Aname, sslbls))
-                    self._remove_layer_component(ilayer + 1, b)
+                        replace_layer_component(ilayer, a, _Label(new_Aname, sslbls))
+                    remove_layer_component(ilayer + 1, b)
 
                 for a in sorted(ilayer_inds_to_remove, reverse=True):
-                    self._remove_layer_component(ilayer, a)
+                    remove_layer_component(ilayer, a)
 
         # returns the flag that tells us whether the algorithm achieved anything.
         return compression_implemented
@@ -2094,24 +2152,30 @@ class Circuit(object):
         # Keeps track of whether any changes have been made to the circuit.
         compression_implemented = False
 
+        # Local references for the loop below
+        line_labels = self.line_labels
+        layer_components = self._layer_components
+        append_layer_component = self._append_layer_component
+        remove_layer_component = self._remove_layer_component
+
         #print("BEGIN")
         used_lines = {}
         for icurlayer in range(len(self._labels)):
             #print("LAYER ",icurlayer)
             #Slide labels in current layer to left ("forward")
             icomps_to_remove = []; used_lines[icurlayer] = set()
-            for icomp, lbl in enumerate(self._layer_components(icurlayer)):
+            for icomp, lbl in enumerate(layer_components(icurlayer)):
                 #see if we can move this label forward
                 #print("COMP%d: %s" % (icomp,str(lbl)))
                 sslbls = _sslbls_of_nested_lists_of_simple_labels(lbl)
-                if sslbls is None: sslbls = self.line_labels
+                if sslbls is None: sslbls = line_labels
 
                 dest_layer = icurlayer
                 while dest_layer > 0 and len(used_lines[dest_layer - 1].intersection(sslbls)) == 0:
                     dest_layer -= 1
                 if dest_layer < icurlayer:
                     icomps_to_remove.append(icomp)  # remove this label from current layer
-                    self._append_layer_component(dest_layer, lbl)  # add it to the destination layer
+                    append_layer_component(dest_layer, lbl)  # add it to the destination layer
                     used_lines[dest_layer].update(sslbls)  # update used_lines at dest layer
                     #print(" <-- layer %d (used=%s)" % (dest_layer,str(used_lines[dest_layer])))
                 else:
@@ -2122,7 +2186,7 @@ class Circuit(object):
             #Remove components in current layer which were pushed forward
             #print("Removing ",icomps_to_remove," from layer ",icurlayer)
             for icomp in reversed(icomps_to_remove):
-                self._remove_layer_component(icurlayer, icomp)
+                remove_layer_component(icurlayer, icomp)
 
             if len(icomps_to_remove) > 0:  # keep track of whether we did anything
                 compression_implemented = True
@@ -2142,14 +2206,11 @@ class Circuit(object):
         """
         assert(not self._static), "Cannot edit a read-only circuit!"
 
-        inds_to_remove = []
-        for ilayer, layer_labels in enumerate(self._labels):
-            if layer_labels == []:
-                inds_to_remove.append(ilayer)
-        for ilayer in reversed(inds_to_remove):
-            del self._labels[ilayer]
+        #Rebuild the layer list once rather than deleting idle layers one-by-one
+        nlayers = len(self._labels)
+        self._labels = [layer_labels for layer_labels in self._labels if layer_labels != []]
 
-        return bool(len(inds_to_remove) > 0)  # whether compression was implemented
+        return bool(len(self._labels) < nlayers)  # whether compression was implemented
 
     def compress_depth(self, oneQgate_relations=None, verbosity=0):
         """
@@ -2197,11 +2258,29 @@ class Circuit(object):
             print("- Implementing circuit depth compression")
             print("  - Circuit depth before compression is {}".format(self.num_layers()))
 
+        #If a previous compression left this circuit (with these relations) unchanged then it's
+        # already fully compressed, and there's no need to run through all the passes again.
+        sig = self._compressed_sig
+        if sig is not None and sig[1] is oneQgate_relations and sig[2] == self._line_labels \
+           and sig[0] == self._labels:
+            if verbosity > 0:
+                print("  - Circuit unchanged by depth compression algorithm")
+                print("  - Circuit depth after compression is {}".format(self.num_layers()))
+            return
+
         flag1 = False
         if oneQgate_relations is not None:
             flag1 = self.combine_oneQgates(oneQgate_relations)
         flag2 = self.shift_gates_forward()
-        flag3 = self.delete_idle_layers()
+
+        #Shifting gates forward moves every gate past any empty layer, so the only idle layers left
+        # are at the end of the circuit: remove these rather than making another pass over all layers.
+        labels = self._labels; nlayers = len(labels)
+        while labels and labels[-1] == []: labels.pop()
+        flag3 = bool(len(labels) < nlayers)
+
+        if not (flag1 or flag2 or flag3):  # a fixed point of the compression passes
+            self._compressed_sig = (_copy_nested_lists(self._labels), oneQgate_relations, self._line_labels)
 
         if verbosity > 0:
             if not (flag1 or flag2 or flag3):
@@ -2311,7 +2390,9 @@ class Circuit(object):
         int
         """
         if self._static:
-            return sum([lbl.depth() for lbl in self._labels])
+            if self._depth is None:  # read-only circuits can cache their depth
+                self._depth = sum([lbl.depth() for lbl in self._labels])
+            return self._depth
         else:
             return sum([_Label(layer_lbl).depth() for layer_lbl in self._labels])
 
@@ -2450,24 +2531,22 @@ class Circuit(object):
     def _togrid(self, identityName):
         """ return a list-of-lists rep? """
         d = self.num_layers()
-        line_items = [[_Label(identityName, ll)] * d for ll in self.line_labels]
+        line_labels = self.line_labels
+        line_items = [[_Label(identityName, ll)] * d for ll in line_labels]
+        line_indices = {ll: i for i, ll in enumerate(line_labels)}  # faster than line_labels.index
 
-        for ilayer in range(len(self._labels)):
+        for ilayer in range(d):
             for layercomp in self._layer_components(ilayer):
                 if isinstance(layercomp, _Label):
+                    #Note: we can't intelligently flatten compound labels that occur within a layer-label yet...
                     comp_label = layercomp
-                    if layercomp.issimple():
-                        comp_sslbls = layercomp.sslbls
-                    else:
-                        #We can't intelligently flatten compound labels that occur within a layer-label yet...
-                        comp_sslbls = layercomp.sslbls
+                    comp_sslbls = layercomp.sslbls
                 else:  # layercomp must be a list (and _static == False)
                     comp_label = _Label(layercomp)
                     comp_sslbls = _sslbls_of_nested_lists_of_simple_labels(layercomp)
-                if comp_sslbls is None: comp_sslbls = self.line_labels
+                if comp_sslbls is None: comp_sslbls = line_labels
                 for sslbl in comp_sslbls:
-                    lineIndx = self.line_labels.index(sslbl)  # replace w/dict for speed...
-                    line_items[lineIndx][ilayer] = comp_label
+                    line_items[line_indices[sslbl]][ilayer] = comp_label
         return line_items
 
     def __str__(self):
@@ -2476,16 +2555,19 @@ class Circuit(object):
         """
 
         # If it's a circuit over no lines, return an empty string
-        if self.number_of_lines() == 0: return ''
+        line_labels = self.line_labels
+        nlines = len(line_labels)
+        if nlines == 0: return ''
 
         s = ''
         Ctxt = 'C'  # if _sys.version_info <= (3, 0) else '\u25CF' # No unicode in
         Ttxt = 'T'  # if _sys.version_info <= (3, 0) else '\u2295' #  Python 2
         identityName = 'I'  # can be anything that isn't used in circuit
+        line_indices = {ll: i for i, ll in enumerate(line_labels)}
 
         def abbrev(lbl, k):  # assumes a simple label w/ name & qubits
             """ Returns what to print on line 'k' for label 'lbl' """
-            lbl_qubits = lbl.qubits if (lbl.qubits is not None) else self.line_labels
+            lbl_qubits = lbl.qubits if (lbl.qubits is not None) else line_labels
             nqubits = len(lbl_qubits)
             if nqubits == 1 and lbl.name is not None:
                 if isinstance(lbl, _CircuitLabel):  # HACK
@@ -2495,12 +2577,12 @@ class Circuit(object):
                 else:
                     return lbl.name
             elif lbl.name in ('CNOT', 'Gcnot') and nqubits == 2:  # qubit indices = (control,target)
-                if k == self.line_labels.index(lbl_qubits[0]):
+                if k == line_indices[lbl_qubits[0]]:
                     return Ctxt + str(lbl_qubits[1])
                 else:
                     return Ttxt + str(lbl_qubits[0])
             elif lbl.name in ('CPHASE', 'Gcphase') and nqubits == 2:
-                if k == self.line_labels.index(lbl_qubits[0]):
+                if k == line_indices[lbl_qubits[0]]:
                     otherqubit = lbl_qubits[1]
                 else:
                     otherqubit = lbl_qubits[0]
@@ -2511,24 +2593,25 @@ class Circuit(object):
                 return str(lbl)
 
         line_items = self._togrid(identityName)
-        max_labellen = [max([len(abbrev(line_items[i][j], i))
-                             for i in range(0, self.number_of_lines())])
-                        for j in range(0, self.num_layers())]
+        abbrevs = [[abbrev(lbl, i) for lbl in row] for i, row in enumerate(line_items)]  # compute each just once
+        max_labellen = [max([len(abbrevs[i][j]) for i in range(nlines)])
+                        for j in range(self.num_layers())]
 
-        max_linelabellen = max([len(str(llabel)) for llabel in self.line_labels])
+        max_linelabellen = max([len(str(llabel)) for llabel in line_labels])
 
-        for i in range(self.number_of_lines()):
-            s += 'Qubit {} '.format(self.line_labels[i]) + ' ' * \
-                (max_linelabellen - len(str(self.line_labels[i]))) + '---'
+        for i in range(nlines):
+            row_items = line_items[i]; row_abbrevs = abbrevs[i]
+            s += 'Qubit {} '.format(line_labels[i]) + ' ' * \
+                (max_linelabellen - len(str(line_labels[i]))) + '---'
             for j, maxlbllen in enumerate(max_labellen):
-                if line_items[i][j].name == identityName:
+                if row_items[j].name == identityName:
                     # Replace with special idle print at some point
                     #s += '-'*(maxlbllen+3) # 1 for each pipe, 1 for joining dash
                     s += '|' + ' ' * (maxlbllen) + '|-'
                 else:
-                    lbl = abbrev(line_items[i][j], i)
+                    lbl = row_abbrevs[j]
                     pad = maxlbllen - len(lbl)
-                    s += '|' + ' ' * int(_np.floor(pad / 2)) + lbl + ' ' * int(_np.ceil(pad / 2)) + '|-'  # + '-'*pad
+                    s += '|' + ' ' * (pad // 2) + lbl + ' ' * (pad - pad // 2) + '|-'  # + '-'*pad
             s += '--\n'
 
         return s
@@ -2578,7 +2661,7 @@ class Circuit(object):
         for j in range(0, self.num_layers()):
             plbl(self[j], "self[%d]" % j)
 
-    def write_Qcircuit_tex(self, filename):  # TODO
+    def write_Qcircuit_tex(self, filename):
         """
         Writes this circuit into a file, containing LaTex that will diplay this circuit using the
         Qcircuit.tex LaTex import (running LaTex requires the Qcircuit.tex file).
@@ -2592,50 +2675,42 @@ class Circuit(object):
         -------
         None
         """
-        raise NotImplementedError("TODO: need to upgrade this method")
-        n = self.number_of_lines()
+        identityName = 'I'  # can be anything that isn't used in circuit
+        line_labels = self.line_labels
+        line_indices = {ll: i for i, ll in enumerate(line_labels)}
+        line_items = self._togrid(identityName)
+        n = len(line_labels)
         d = self.num_layers()
 
-        f = open(filename, 'w')
-        f.write("\documentclass{article}\n")
-        f.write("\\usepackage{mathtools}\n")
-        f.write("\\usepackage{xcolor}\n")
-        f.write("\\usepackage[paperwidth=" + str(5. + d * .3)
-                + "in, paperheight=" + str(2 + n * 0.2) + "in,margin=0.5in]{geometry}")
-        f.write("\input{Qcircuit}\n")
-        f.write("\\begin{document}\n")
-        f.write("\\begin{equation*}\n")
-        f.write("\Qcircuit @C=1.0em @R=0.5em {\n")
-
-        for q in range(0, n):
-            qstring = '&'
-            # The quantum wire for qubit q
-            circuit_for_q = self.line_items[q]
-            for gate in circuit_for_q:
-                gate_qubits = gate.qubits if (gate.qubits is not None) else self.line_labels
-                nqubits = len(gate_qubits)
-                if gate.name == self.identity:
-                    qstring += ' \qw &'
-                elif gate.name in ('CNOT', 'Gcnot') and nqubits == 2:
-                    if gate_qubits[0] == q:
-                        qstring += ' \ctrl{' + str(gate_qubits[1] - q) + '} &'
+        with open(filename, 'w') as f:
+            f.write("\\documentclass{article}\n")
+            f.write("\\usepackage{mathtools}\n")
+            f.write("\\usepackage{xcolor}\n")
+            f.write("\\usepackage[paperwidth=" + str(5. + d * .3)
+                    + "in, paperheight=" + str(2 + n * 0.2) + "in,margin=0.5in]{geometry}")
+            f.write("\\input{Qcircuit}\n")
+            f.write("\\begin{document}\n")
+            f.write("\\begin{equation*}\n")
+            f.write("\\Qcircuit @C=1.0em @R=0.5em {\n")
+
+            for q in range(n):
+                # The quantum wire for qubit q
+                cells = ['&']
+                for gate in line_items[q]:
+                    if gate.name == identityName:
+                        cells.append(' \\qw &')
+                        continue
+                    gate_qubits = gate.sslbls if (gate.sslbls is not None) else line_labels
+                    cell_fn = _QCIRCUIT_2Q_CELLS.get(gate.name, None) if len(gate_qubits) == 2 else None
+                    if cell_fn is not None:
+                        cells.append(cell_fn(line_indices[gate_qubits[0]], line_indices[gate_qubits[1]], q))
                     else:
-                        qstring += ' \\targ &'
-                elif gate.name in ('CPHASE', 'Gcphase') and nqubits == 2:
-                    if gate_qubits[0] == q:
-                        qstring += ' \ctrl{' + str(gate_qubits[1] - q) + '} &'
-                    else:
-                        qstring += ' \control \qw &'
-
-                else:
-                    qstring += ' \gate{' + str(gate.name) + '} &'
-
-            qstring += ' \qw & \\' + '\\ \n'
-            f.write(qstring)
+                        cells.append(' \\gate{' + str(gate.name) + '} &')
+                cells.append(' \\qw & \\\\ \n')
+                f.write(''.join(cells))
 
-        f.write("}\end{equation*}\n")
-        f.write("\end{document}")
-        f.close()
+            f.write("}\\end{equation*}\n")
+            f.write("\\end{document}")
 
     def convert_to_quil(self,
                         gatename_conversion=None,
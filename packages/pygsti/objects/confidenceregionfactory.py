@@ -99,6 +99,7 @@ class ConfidenceRegionFactory(object):
         self.inv_hessian_projections = _collections.OrderedDict()
         self.linresponse_mlgst_params = None
         self.nNonGaugeParams = self.nGaugeParams = None
+        self._views = {}  # cached views, see :method:`view`
 
         self.model_lbl = model_lbl
         self.circuit_list_lbl = circuit_list_lbl
@@ -108,6 +109,7 @@ class ConfidenceRegionFactory(object):
         # don't pickle parent (will create circular reference)
         to_pickle = self.__dict__.copy()
         del to_pickle['parent']
+        to_pickle['_views'] = {}  # views are re-created as needed
 
         # *don't* pickle any Comm objects
         if self.linresponse_mlgst_params and "comm" in self.linresponse_mlgst_params:
@@ -116,6 +118,7 @@ class ConfidenceRegionFactory(object):
         return to_pickle
 
     def __setstate__(self, stateDict):
+        if '_views' not in stateDict: stateDict['_views'] = {}
         self.__dict__.update(stateDict)
         self.parent = None  # initialize to None upon unpickling
 
@@ -259,6 +262,7 @@ class ConfidenceRegionFactory(object):
 
         self.hessian = hessian
         self.nonMarkRadiusSq = nonMarkRadiusSq
+        self._views.clear()
         return hessian
 
     def project_hessian(self, projection_type, label=None, tol=1e-7, maxiter=10000):
@@ -345,6 +349,7 @@ class ConfidenceRegionFactory(object):
         inv_projected_hessian = _np.dot(U, _np.dot(inv_projected_hessian, Udag))
 
         #save input args for copying object
+        self._views.clear()
         self.inv_hessian_projections[label] = inv_projected_hessian
         self.hessian_projection_parameters[label] = {
             'projection_type': projection_type,
@@ -404,6 +409,7 @@ class ConfidenceRegionFactory(object):
         #Count everything as non-gauge? TODO BETTER
         self.nNonGaugeParams = self.get_model().num_params()
         self.nGaugeParams = 0
+        self._views.clear()
 
     def view(self, confidenceLevel, regionType='normal',
              hessian_projection_label=None):
@@ -463,9 +469,17 @@ class ConfidenceRegionFactory(object):
         else:
             raise ValueError("Invalid confidence region type: %s" % regionType)
 
-        return ConfidenceRegionFactoryView(model, inv_hessian_projection, linresponse_mlgst_params,
+        #Views are cached, since the same one is often requested repeatedly (e.g. by reports).
+        # A cached view is only valid for the model object it was constructed from.
+        view_key = (confidenceLevel, regionType, hessian_projection_label)
+        if view_key in self._views and self._views[view_key][0] is model:
+            return self._views[view_key][1]
+
+        view = ConfidenceRegionFactoryView(model, inv_hessian_projection, linresponse_mlgst_params,
                                            confidenceLevel, nonMarkRadiusSq,
                                            self.nNonGaugeParams, self.nGaugeParams)
+        self._views[view_key] = (model, view)
+        return view
 
         #TODO: where to move this?
         ##Check that number of gauge parameters reported by model is consistent with confidence region
@@ -710,6 +724,7 @@ class ConfidenceRegionFactoryView(object):
         to_pickle = self.__dict__.copy()
         if self.mlgst_params and "comm" in self.mlgst_params:
             del self.mlgst_params['comm']  # one *cannot* pickle Comm objects
+        to_pickle['mlgst_evaltree_cache'] = {}  # eval trees are re-created as needed
         return to_pickle
 
     def get_errobar_type(self):
@@ -10,6 +10,7 @@ from __future__ import division, print_function, absolute_import, unicode_litera
 #***************************************************************************************************
 
 import numpy as _np
+import scipy.linalg as _spl
 import collections as _collections
 import warnings as _warnings
 import copy as _copy
@@ -17,7 +18,9 @@ import copy as _copy
 from ..baseobjs import VerbosityPrinter as _VerbosityPrinter
 from .. import tools as _tools
 from ..tools import compattools as _compat
+from ..tools import mpitools as _mpit
 from .confidenceregionfactory import ConfidenceRegionFactory as _ConfidenceRegionFactory
+from .explicitmodel import ExplicitOpModel as _ExplicitOpModel
 
 #Class for holding confidence region factory keys
 CRFkey = _collections.namedtuple('CRFkey', ['model', 'circuit_list'])
@@ -83,6 +86,14 @@ class Estimate(object):
         #Meta info
         self.meta = {}
 
+        #Cached effective (scaled) data set and plaquettes - see get_effective_dataset
+        self._effective_ds_key = None
+        self._effective_ds_cache = None
+        self._plaq_cache = {}
+
+        #Index at which to start looking for a free "go<X>" label
+        self._next_go_index = 0
+
     def get_start_model(self, goparams):
         """
         Returns the starting model for the gauge optimization given by `goparams`.
@@ -151,11 +162,12 @@ class Estimate(object):
         """
 
         if label is None:
-            i = 0
+            i = self._next_go_index
             while True:
                 label = "go%d" % i; i += 1
                 if (label not in self.goparameters) and \
                    (label not in self.models): break
+            self._next_go_index = i
 
         goparams_list = [goparams] if hasattr(goparams, 'keys') else goparams
         ordered_goparams = []
@@ -304,7 +316,7 @@ class Estimate(object):
 
     def gauge_propagate_confidence_region_factory(
             self, to_model_label, from_model_label='final iteration estimate',
-            circuits_label='final', EPS=1e-3, verbosity=0):
+            circuits_label='final', EPS=1e-3, verbosity=0, comm=None):
         """
         Propagates an existing "reference" confidence region for a Model
         "G0" to a new confidence region for a gauge-equivalent model "G1".
@@ -339,13 +351,17 @@ class Estimate(object):
             A non-negative integer indicating the amount of detail to print
             to stdout.
 
+        comm : mpi4py.MPI.Comm, optional
+            When not None, an MPI communicator for distributing the
+            finite-difference columns across multiple processors.
+
         Returns
         -------
         ConfidenceRegionFactory
             Note: this region is also stored internally and as such the return
             value of this function can often be ignored.
         """
-        printer = _VerbosityPrinter.build_printer(verbosity)
+        printer = _VerbosityPrinter.build_printer(verbosity, comm)
 
         ref_model = self.models[from_model_label]
         goparams = self.goparameters[to_model_label]
@@ -368,32 +384,21 @@ class Estimate(object):
         assert(crf is not None), "Initial confidence region factory doesn't exist!"
         assert(crf.has_hessian()), "Initial factory must contain a computed Hessian!"
 
-        #Update hessian by TMx = d(diffs in current go'd model)/d(diffs in ref model)
-        TMx = _np.empty((final_model.num_params(), ref_model.num_params()), 'd')
-        v0, w0 = ref_model.to_vector(), final_model.to_vector()
-        mdl = ref_model.copy()
-
         printer.log(" *** Propagating Hessian from '%s' to '%s' ***" %
                     (from_model_label, to_model_label))
 
+        #Update hessian by TMx = d(diffs in current go'd model)/d(diffs in ref model)
         with printer.progress_logging(1):
-            for iCol in range(ref_model.num_params()):
-                v = v0.copy(); v[iCol] += EPS  # dv is along iCol-th direction
-                mdl.from_vector(v)
-                for gaugeGroupEl in gaugeGroupEls:
-                    mdl.transform(gaugeGroupEl)
-                w = mdl.to_vector()
-                dw = (w - w0) / EPS
-                TMx[:, iCol] = dw
-                printer.show_progress(iCol, ref_model.num_params(), prefix='Column: ')
-                #,suffix = "; finite_diff = %g" % _np.linalg.norm(dw)
-
-        #rank = _np.linalg.matrix_rank(TMx)
-        #print("DEBUG: constructed TMx: rank = ", rank)
+            TMx = _gauge_jacobian(ref_model, final_model, gaugeGroupEls, EPS, printer, comm)
 
-        # Hessian is gauge-transported via H -> TMx_inv^T * H * TMx_inv
-        TMx_inv = _np.linalg.inv(TMx)
-        new_hessian = _np.dot(TMx_inv.T, _np.dot(crf.hessian, TMx_inv))
+        # Hessian is gauge-transported via H -> TMx_inv^T * H * TMx_inv, which we
+        # compute using two solves with a single LU factorization of TMx^T rather
+        # than explicitly inverting TMx.
+        lu_piv = _spl.lu_factor(TMx.T, check_finite=False)
+        if _np.min(_np.abs(_np.diag(lu_piv[0]))) == 0.0:
+            raise _np.linalg.LinAlgError("Singular gauge-transport matrix!")
+        new_hessian = _spl.lu_solve(lu_piv, _spl.lu_solve(lu_piv, crf.hessian, check_finite=False).T,
+                                    check_finite=False)
 
         #Create a new confidence region based on the new hessian
         new_crf = _ConfidenceRegionFactory(self, to_model_label,
@@ -435,27 +440,43 @@ class Estimate(object):
         weights = self.parameters.get("weights", None)
 
         if weights is not None:
-            scaled_dataset = p.dataset.copy_nonstatic()
+            #Only a static data set's scaled version is cached, as a non-static one may be edited in
+            # place.  The weights are compared by value, since they may also be edited in place.
+            key = self._effective_ds_key
+            if key is not None and key[0] is p.dataset and key[1] is gss and key[2] == weights \
+               and p.dataset.bStatic and not return_subMxs:
+                return self._effective_ds_cache
+
+            #Only copy the data set when some weight actually changes it
+            scale_data = any(w != 1.0 for w in weights.values())
+            if not scale_data and not return_subMxs:
+                return p.dataset
+
+            scaled_dataset = p.dataset.copy_nonstatic() if scale_data else p.dataset
             nRows, nCols = gss.plaquette_rows_cols()
 
             subMxs = []
-            for y in gss.used_yvals():
+            for plaq_row in self._get_plaquettes(gss, True):
                 subMxs.append([])
-                for x in gss.used_xvals():
-                    scalingMx = _np.nan * _np.ones((nRows, nCols), 'd')
-                    plaq = gss.get_plaquette(x, y).expand_aliases()
+                for plaq in plaq_row:
+                    scalingMx = _np.full((nRows, nCols), _np.nan, 'd')
                     if len(plaq) > 0:
-                        for i, j, opstr in plaq:
-                            scalingMx[i, j] = weights.get(opstr, 1.0)
-                            if scalingMx[i, j] != 1.0:
-                                scaled_dataset[opstr].scale(scalingMx[i, j])
+                        rows, cols, opstrs = zip(*plaq)
+                        scales = _np.array([weights.get(opstr, 1.0) for opstr in opstrs], 'd')
+                        scalingMx[rows, cols] = scales
+                        for k in _np.nonzero(scales != 1.0)[0]:
+                            scaled_dataset[opstrs[k]].scale(scales[k])
 
                     #build up a subMxs list-of-lists as a plotting
                     # function does, so we can easily plot the scaling
                     # factors in a color box plot.
                     subMxs[-1].append(scalingMx)
 
-            scaled_dataset.done_adding_data()
+            if scale_data:
+                scaled_dataset.done_adding_data()
+                if p.dataset.bStatic:
+                    self._effective_ds_key = (p.dataset, gss, dict(weights))
+                    self._effective_ds_cache = scaled_dataset
             if return_subMxs:
                 return scaled_dataset, subMxs
             else: return scaled_dataset
@@ -464,11 +485,10 @@ class Estimate(object):
 
             if return_subMxs:  # then need to create subMxs with all 1's
                 subMxs = []
-                for y in gss.used_yvals():
+                for plaq_row in self._get_plaquettes(gss, False):
                     subMxs.append([])
-                    for x in gss.used_xvals():
-                        plaq = gss.get_plaquette(x, y)
-                        scalingMx = _np.nan * _np.ones((plaq.rows, plaq.cols), 'd')
+                    for plaq in plaq_row:
+                        scalingMx = _np.full((plaq.rows, plaq.cols), _np.nan, 'd')
                         for i, j, opstr in plaq:
                             scalingMx[i, j] = 1.0
                         subMxs[-1].append(scalingMx)
@@ -476,6 +496,24 @@ class Estimate(object):
             else:
                 return p.dataset
 
+    def _get_plaquettes(self, gss, expand_aliases):
+        """
+        Returns the list-of-lists (rows indexed by y-value, columns by x-value)
+        of the used plaquettes of `gss`, optionally with aliases expanded.
+        These are cached, since finding the used x- and y-values alone
+        requires looking up every plaquette of `gss`.
+        """
+        cached = self._plaq_cache.get(expand_aliases, None)
+        if cached is not None and cached[0] is gss:  # only valid for the very same structure object
+            return cached[1]
+
+        xvals = gss.used_xvals()
+        plaquettes = [[gss.get_plaquette(x, y) for x in xvals] for y in gss.used_yvals()]
+        if expand_aliases:
+            plaquettes = [[plaq.expand_aliases() for plaq in plaq_row] for plaq_row in plaquettes]
+        self._plaq_cache[expand_aliases] = (gss, plaquettes)
+        return plaquettes
+
     def misfit_sigma(self, use_accurate_Np=False, evaltree_cache=None, comm=None):
         """
         Returns the number of standard deviations (sigma) of model violation.
@@ -514,10 +552,13 @@ class Estimate(object):
                                  opLabelAliases=gss.aliases,
                                  evaltree_cache=evaltree_cache, comm=comm)
         elif obj in ("logl", "lgst"):
-            logL_upperbound = _tools.logl_max(mdl, ds, gss.allstrs, opLabelAliases=gss.aliases,
-                                              evaltree_cache=evaltree_cache)
+            #Compute logl first so logl_max can use the evaluation tree (and its
+            # circuit simplifications) that logl stores in the cache.
+            if evaltree_cache is None: evaltree_cache = {}
             logl = _tools.logl(mdl, ds, gss.allstrs, opLabelAliases=gss.aliases,
                                evaltree_cache=evaltree_cache, comm=comm)
+            logL_upperbound = _tools.logl_max(mdl, ds, gss.allstrs, opLabelAliases=gss.aliases,
+                                              evaltree_cache=evaltree_cache)
             fitQty = 2 * (logL_upperbound - logl)  # twoDeltaLogL
 
         ds_allstrs = _tools.find_replace_tuple_list(
@@ -564,15 +605,41 @@ class Estimate(object):
 
         return view
 
-    def copy(self):
-        """ Creates a copy of this Estimate object. """
-        #TODO: check whether this deep copies (if we want it to...) - I expect it doesn't currently
+    def copy(self, deep=False):
+        """
+        Creates a copy of this Estimate object.
+
+        Parameters
+        ----------
+        deep : bool, optional
+            Whether the `Model` objects of this estimate are copied too.  If
+            False, they are shared by the copy.  Parameter dictionaries,
+            confidence region factories and meta-data are always copied.
+
+        Returns
+        -------
+        Estimate
+        """
         cpy = Estimate(self.parent)
-        cpy.parameters = _copy.deepcopy(self.parameters)
-        cpy.goparameters = _copy.deepcopy(self.goparameters)
-        cpy.models = self.models.copy()
-        cpy.confidence_region_factories = _copy.deepcopy(self.confidence_region_factories)
-        cpy.meta = _copy.deepcopy(self.meta)
+
+        #Using a common memo means each model is copied (or not) just once, even
+        # when it is also referenced within goparameters.
+        memo = {}
+        if deep:
+            cpy.models = _copy.deepcopy(self.models, memo)
+        else:
+            for mdl_or_list in self.models.values():
+                memo[id(mdl_or_list)] = mdl_or_list
+                if isinstance(mdl_or_list, list):
+                    memo.update({id(mdl): mdl for mdl in mdl_or_list})
+            cpy.models = self.models.copy()
+
+        cpy.parameters = _copy.deepcopy(self.parameters, memo)
+        cpy.goparameters = _copy.deepcopy(self.goparameters, memo)
+        cpy.confidence_region_factories = _copy.deepcopy(self.confidence_region_factories, memo)
+        for crf in cpy.confidence_region_factories.values():
+            crf.set_parent(cpy)  # (parents aren't copied)
+        cpy.meta = _copy.deepcopy(self.meta, memo)
         return cpy
 
     def __str__(self):
@@ -616,6 +683,13 @@ class Estimate(object):
 
         # don't pickle parent (will create circular reference)
         del to_pickle['parent']
+
+        # don't pickle cached values (they reference the parent's objects and are re-created as needed)
+        for attr in [k for k in to_pickle if k.endswith('_cache')] + ['_effective_ds_key']:
+            del to_pickle[attr]
+
+        # Note: arrays (e.g. Hessians) are left for numpy to pickle, so that they can be
+        # written out-of-band when pickling with protocol 5 and a `buffer_callback`.
         return to_pickle
 
     def __setstate__(self, stateDict):
@@ -624,10 +698,16 @@ class Estimate(object):
             del stateDict['confidence_regions']
             stateDict['confidence_region_factories'] = _collections.OrderedDict()
         if 'meta' not in stateDict: stateDict['meta'] = {}
+        if '_next_go_index' not in stateDict: stateDict['_next_go_index'] = 0
         if 'gatesets' in stateDict:
             stateDict['models'] = stateDict['gatesets']
             del stateDict['gatesets']
 
+        #Cached values aren't pickled (see __getstate__)
+        stateDict['_effective_ds_key'] = None
+        stateDict['_effective_ds_cache'] = None
+        stateDict['_plaq_cache'] = {}
+
         self.__dict__.update(stateDict)
         for crf in self.confidence_region_factories.values():
             crf.set_parent(self)
@@ -638,3 +718,95 @@ class Estimate(object):
         Sets the parent Results object of this Estimate.
         """
         self.parent = parent
+
+        #Cached values are derived from the parent's data set & circuit structures
+        self._effective_ds_key = None
+        self._effective_ds_cache = None
+        self._plaq_cache = {}
+
+
+def _gauge_jacobian(ref_model, final_model, gaugeGroupEls, EPS, printer, comm=None):
+    """
+    Computes, by finite differences, the Jacobian of the map that takes the
+    parameters of `ref_model` to those of `final_model` by applying each of
+    the elements in `gaugeGroupEls` in turn.  When `comm` is not None the
+    columns are divided among its processors and then gathered, so that
+    every processor returns the entire Jacobian.
+
+    Returns
+    -------
+    numpy.ndarray
+        A `(final_model.num_params(), ref_model.num_params())` array.
+    """
+    nParams = ref_model.num_params()
+    TMx = _np.empty((final_model.num_params(), nParams), 'd')
+    v0, w0 = ref_model.to_vector(), final_model.to_vector()
+
+    slices, loc_slice, owners, _ = _mpit.distribute_slice(slice(0, nParams), comm)
+    loc_cols = range(nParams)[loc_slice]
+
+    #show_progress prints (and flushes stdout) even when it has nothing to show
+    bShowProgress = printer.verbosity >= 1
+
+    blocks = _member_param_blocks(ref_model)
+    if blocks is not None:
+        #Each parameter belongs to exactly one model member, which is the only
+        # member that changes when that parameter is perturbed: just transform it.
+        TMx[:, loc_slice] = 0.0
+        for member, typ_args, inds in blocks:
+            lv0 = v0[inds]; lw0 = w0[inds]
+            lv = lv0.copy()
+            for k, iCol in enumerate(inds):
+                if iCol not in loc_cols: continue
+                lv[k] = lv0[k] + EPS  # dv is along iCol-th direction
+                member.from_vector(lv)
+                for gaugeGroupEl in gaugeGroupEls:
+                    member.transform(gaugeGroupEl, *typ_args)
+                TMx[inds, iCol] = member.to_vector() - lw0
+                lv[k] = lv0[k]
+                if bShowProgress: printer.show_progress(iCol, nParams, prefix='Column: ')
+    else:
+        mdl = ref_model.copy()  # a single model, re-used for each column
+        v = v0.copy()  # a single parameter buffer, updated in place for each column
+        for iCol in loc_cols:
+            if iCol > loc_cols[0]: v[iCol - 1] = v0[iCol - 1]
+            v[iCol] = v0[iCol] + EPS  # dv is along iCol-th direction
+            mdl.from_vector(v)
+            for gaugeGroupEl in gaugeGroupEls:
+                mdl.transform(gaugeGroupEl)
+            TMx[:, iCol] = mdl.to_vector()
+            TMx[:, iCol] -= w0
+            if bShowProgress: printer.show_progress(iCol, nParams, prefix='Column: ')
+
+    TMx[:, loc_slice] *= 1.0 / EPS
+    _mpit.gather_slices(slices, owners, TMx, [], 1, comm)
+    return TMx
+
+
+def _member_param_blocks(model):
+    """
+    Splits the parameters of an explicit `model` among (copies of) its members.
+
+    Returns
+    -------
+    list or None
+        A list of `(member, typ_args, inds)` tuples, where `inds` are the
+        model-parameter indices of `member` and `typ_args` are the extra
+        arguments to pass to `member.transform`.  None is returned when
+        `model` isn't an `ExplicitOpModel` or its members don't partition its
+        parameters (e.g. when parameters are shared between members).
+    """
+    if not isinstance(model, _ExplicitOpModel): return None
+
+    nParams = model.num_params()
+    allInds = _np.arange(nParams)
+    nOwners = _np.zeros(nParams, _np.int64)
+    blocks = []
+    for typ_args, members in ((('prep',), model.preps), ((), model.povms),
+                              ((), model.operations), ((), model.instruments)):
+        for member in members.values():
+            inds = allInds[member.gpindices]
+            nOwners[inds] += 1
+            blocks.append((member.copy(), typ_args, inds))
+
+    return blocks if _np.all(nOwners == 1) else None
@@ -22,9 +22,14 @@ from .estimate import Estimate as _Estimate
 from .gaugegroup import TrivialGaugeGroup as _TrivialGaugeGroup
 from .gaugegroup import TrivialGaugeGroupElement as _TrivialGaugeGroupElement
 
-#A flag to enable fast-loading of old results files (should
-# only be changed by experts)
-_SHORTCUT_OLD_RESULTS_LOAD = False
+_REINIT_MSG = "Re-initializing the %s estimate of this Results object!  Usually you don't want to do this."
+_DEPRECATED_STATE_KEYS = {'gatestring_lists': 'circuit_lists', 'gatestring_structs': 'circuit_structs'}
+_REMOVED_REPORT_FN_MSG = ('%s(...) has been removed from pyGSTi.\n'
+                          '  Starting in version 0.9.4, pyGSTi\'s PDF reports have been\n'
+                          '  significantly upgraded.  As a part of this change,\n'
+                          '  the functions that generate reports are now separate functions.\n'
+                          '  Please update this call with one to:\n'
+                          '  pygsti.report.create_standard_report(...)\n')
 
 
 class Results(object):
@@ -118,13 +123,16 @@ class Results(object):
         self.circuit_lists['iteration'] = \
             [gss.allstrs for gss in self.circuit_structs['iteration']]
         self.circuit_lists['final'] = self.circuit_lists['iteration'][-1]
-        self.circuit_lists['all'] = _tools.remove_duplicates(
-            list(_itertools.chain(*self.circuit_lists['iteration'])))
 
         running_set = set(); delta_lsts = []
         for lst in self.circuit_lists['iteration']:
             delta_lst = [x for x in lst if (x not in running_set)]
             delta_lsts.append(delta_lst); running_set.update(delta_lst)
+
+        #The deltas hold the first occurrence of each circuit in iteration order, so
+        # they (rather than the typically nested, overlapping iteration lists) give 'all'
+        self.circuit_lists['all'] = _tools.remove_duplicates(
+            _itertools.chain.from_iterable(delta_lsts))
         self.circuit_lists['iteration delta'] = delta_lsts  # *added* at each iteration
 
         #Set "Ls and germs" info: gives particular structure
@@ -139,7 +147,7 @@ class Results(object):
             self.circuit_lists['effect fiducials'] = []
             self.circuit_lists['germs'] = []
 
-    def add_estimates(self, results, estimatesToAdd=None):
+    def add_estimates(self, results, estimatesToAdd=None, quiet=False):
         """
         Add some or all of the estimates from `results` to this `Results` object.
 
@@ -154,6 +162,9 @@ class Results(object):
             A list of estimate keys to import from `results`.  If None, then all
             the estimates contained in `results` are imported.
 
+        quiet : bool, optional
+            If True, don't warn when an existing estimate is overwritten.
+
         Returns
         -------
         None
@@ -170,13 +181,18 @@ class Results(object):
         assert(len(self.circuit_structs['iteration']) == len(results.circuit_structs['iteration'])), \
             "Iteration count inconsistency: cannot import estimates!"
 
-        for estimate_key in results.estimates:
-            if estimatesToAdd is None or estimate_key in estimatesToAdd:
-                if estimate_key in self.estimates:
-                    _warnings.warn("Re-initializing the %s estimate" % estimate_key
-                                   + " of this Results object!  Usually you don't"
-                                   + " want to do this.")
-                self.estimates[estimate_key] = results.estimates[estimate_key]
+        if estimatesToAdd is None:
+            items_to_add = list(results.estimates.items())
+        else:
+            estimatesToAdd = frozenset(estimatesToAdd)
+            items_to_add = [(k, est) for k, est in results.estimates.items() if k in estimatesToAdd]
+
+        estimates = self.estimates
+        if not quiet:
+            for estimate_key, _ in items_to_add:
+                if estimate_key in estimates:
+                    _warnings.warn(_REINIT_MSG % estimate_key)
+        estimates.update(items_to_add)
 
     def rename_estimate(self, old_name, new_name):
         """
@@ -233,7 +249,7 @@ class Results(object):
             dict.__setitem__(self.estimates, new_name, value)
 
     def add_estimate(self, targetModel, seedModel, modeslByIter,
-                     parameters, estimate_key='default'):
+                     parameters, estimate_key='default', quiet=False):
         """
         Add a set of `Model` estimates to this `Results` object.
 
@@ -258,6 +274,9 @@ class Results(object):
         estimate_key : str, optional
             The key or label used to identify this estimate.
 
+        quiet : bool, optional
+            If True, don't warn when an existing estimate is overwritten.
+
         Returns
         -------
         None
@@ -273,17 +292,14 @@ class Results(object):
         la, lb = len(self.circuit_structs['iteration']), len(modeslByIter)
         assert(la == lb), "Number of iterations (%d) must equal %d!" % (lb, la)
 
-        if estimate_key in self.estimates:
-            _warnings.warn("Re-initializing the %s estimate" % estimate_key
-                           + " of this Results object!  Usually you don't"
-                           + " want to do this.")
+        if not quiet and estimate_key in self.estimates:
+            _warnings.warn(_REINIT_MSG % estimate_key)
 
-        self.estimates[estimate_key] = _Estimate(self, targetModel, seedModel,
-                                                 modeslByIter, parameters)
+        est = _Estimate(self, targetModel, seedModel, modeslByIter, parameters)
+        self.estimates[estimate_key] = est
 
         #Set gate sequence related parameters inherited from Results
-        self.estimates[estimate_key].parameters['max length list'] = \
-            self.circuit_structs['final'].Ls
+        est.parameters['max length list'] = self.circuit_structs['final'].Ls
 
     def add_model_test(self, targetModel, themodel,
                        estimate_key='test', gauge_opt_keys="auto"):
@@ -395,15 +411,30 @@ class Results(object):
 
         return view
 
-    def copy(self):
-        """ Creates a copy of this Results object. """
-        #TODO: check whether this deep copies (if we want it to...) - I expect it doesn't currently
+    def copy(self, deep=False):
+        """
+        Creates a copy of this Results object.
+
+        Parameters
+        ----------
+        deep : bool, optional
+            Whether the estimates' `Model` objects are copied too.  If False,
+            they are shared by the copy.  The `DataSet` (see
+            :method:`DataSet.copy`, which doesn't duplicate a static data set)
+            and the circuit lists and structures are always copied.
+
+        Returns
+        -------
+        Results
+        """
         cpy = Results()
         cpy.dataset = self.dataset.copy()
-        cpy.circuit_lists = _copy.deepcopy(self.circuit_lists)
-        cpy.circuit_structs = _copy.deepcopy(self.circuit_structs)
+        memo = {}  # circuit_lists mostly references the circuit_structs' own lists: copy these once
+        cpy.circuit_structs = _copy.deepcopy(self.circuit_structs, memo)
+        cpy.circuit_lists = _copy.deepcopy(self.circuit_lists, memo)
         for est_key, est in self.estimates.items():
-            cpy.estimates[est_key] = est.copy()
+            cpy.estimates[est_key] = est.copy(deep)
+            cpy.estimates[est_key].set_parent(cpy)
         return cpy
 
     def __setstate__(self, stateDict):
@@ -415,10 +446,8 @@ class Results(object):
 
         if 'gatestring_lists' in stateDict:
             _warnings.warn("Unpickling deprecated-format Results.  Please re-save/pickle asap.")
-            self.circuit_lists = stateDict['gatestring_lists']
-            self.circuit_structs = stateDict['gatestring_structs']
-            del stateDict['gatestring_lists']
-            del stateDict['gatestring_structs']
+            for old_key, new_key in _DEPRECATED_STATE_KEYS.items():
+                stateDict[new_key] = stateDict.pop(old_key)
 
         #unpickle normally
         self.__dict__.update(stateDict)
@@ -426,25 +455,25 @@ class Results(object):
             est.set_parent(self)
 
     def __str__(self):
-        s = "----------------------------------------------------------\n"
-        s += "---------------- pyGSTi Results Object -------------------\n"
-        s += "----------------------------------------------------------\n"
-        s += "\n"
-        s += "How to access my contents:\n\n"
-        s += " .dataset    -- the DataSet used to generate these results\n\n"
-        s += " .circuit_lists   -- a dict of Circuit lists w/keys:\n"
-        s += " ---------------------------------------------------------\n"
-        s += "  " + "\n  ".join(list(self.circuit_lists.keys())) + "\n"
-        s += "\n"
-        s += " .circuit_structs   -- a dict of CircuitStructures w/keys:\n"
-        s += " ---------------------------------------------------------\n"
-        s += "  " + "\n  ".join(list(self.circuit_structs.keys())) + "\n"
-        s += "\n"
-        s += " .estimates   -- a dictionary of Estimate objects:\n"
-        s += " ---------------------------------------------------------\n"
-        s += "  " + "\n  ".join(list(self.estimates.keys())) + "\n"
-        s += "\n"
-        return s
+        return "".join([
+            "----------------------------------------------------------\n",
+            "---------------- pyGSTi Results Object -------------------\n",
+            "----------------------------------------------------------\n",
+            "\n",
+            "How to access my contents:\n\n",
+            " .dataset    -- the DataSet used to generate these results\n\n",
+            " .circuit_lists   -- a dict of Circuit lists w/keys:\n",
+            " ---------------------------------------------------------\n",
+            "  ", "\n  ".join(list(self.circuit_lists.keys())), "\n",
+            "\n",
+            " .circuit_structs   -- a dict of CircuitStructures w/keys:\n",
+            " ---------------------------------------------------------\n",
+            "  ", "\n  ".join(list(self.circuit_structs.keys())), "\n",
+            "\n",
+            " .estimates   -- a dictionary of Estimate objects:\n",
+            " ---------------------------------------------------------\n",
+            "  ", "\n  ".join(list(self.estimates.keys())), "\n",
+            "\n"])
 
     #OLD Methods for generating reports which have been removed - show alert
     # message directing users to new factory functions
@@ -456,26 +485,14 @@ class Results(object):
                                pureDataAppendix=False, m=0, M=10, tips=False,
                                verbosity=0, comm=None):
         """ DEPRECATED: use pygsti.report.create_standard_report(...) """
-        _warnings.warn(
-            ('create_full_report_pdf(...) has been removed from pyGSTi.\n'
-             '  Starting in version 0.9.4, pyGSTi\'s PDF reports have been\n'
-             '  significantly upgraded.  As a part of this change,\n'
-             '  the functions that generate reports are now separate functions.\n'
-             '  Please update this call with one to:\n'
-             '  pygsti.report.create_standard_report(...)\n'))
+        _warnings.warn(_REMOVED_REPORT_FN_MSG % 'create_full_report_pdf')
 
     def create_brief_report_pdf(self, confidenceLevel=None,
                                 filename="auto", title="auto", datasetLabel="auto",
                                 suffix="", m=0, M=10, tips=False, verbosity=0,
                                 comm=None):
         """ DEPRECATED: use pygsti.report.create_standard_report(...) """
-        _warnings.warn(
-            ('create_brief_report_pdf(...) has been removed from pyGSTi.\n'
-             '  Starting in version 0.9.4, pyGSTi\'s PDF reports have been\n'
-             '  significantly upgraded.  As a part of this change,\n'
-             '  the functions that generate reports are now separate functions.\n'
-             '  Please update this call with one to:\n'
-             '  pygsti.report.create_standard_report(...)\n'))
+        _warnings.warn(_REMOVED_REPORT_FN_MSG % 'create_brief_report_pdf')
 
     def create_presentation_pdf(self, confidenceLevel=None, filename="auto",
                                 title="auto", datasetLabel="auto", suffix="",
@@ -483,13 +500,7 @@ class Results(object):
                                 pixelPlotAppendix=False, whackamoleAppendix=False,
                                 m=0, M=10, verbosity=0, comm=None):
         """ DEPRECATED: use pygsti.report.create_standard_report(...) """
-        _warnings.warn(
-            ('create_presentation_pdf(...) has been removed from pyGSTi.\n'
-             '  Starting in version 0.9.4, pyGSTi\'s PDF reports have been\n'
-             '  significantly upgraded.  As a part of this change,\n'
-             '  the functions that generate reports are now separate functions.\n'
-             '  Please update this call with one to:\n'
-             '  pygsti.report.create_standard_report(...)\n'))
+        _warnings.warn(_REMOVED_REPORT_FN_MSG % 'create_presentation_pdf')
 
     def create_presentation_ppt(self, confidenceLevel=None, filename="auto",
                                 title="auto", datasetLabel="auto", suffix="",
@@ -497,23 +508,11 @@ class Results(object):
                                 pixelPlotAppendix=False, whackamoleAppendix=False,
                                 m=0, M=10, verbosity=0, pptTables=False, comm=None):
         """ DEPRECATED: use pygsti.report.create_standard_report(...) """
-        _warnings.warn(
-            ('create_presentation_ppt(...) has been removed from pyGSTi.\n'
-             '  Starting in version 0.9.4, pyGSTi\'s PDF reports have been\n'
-             '  significantly upgraded.  As a part of this change,\n'
-             '  the functions that generate reports are now separate functions.\n'
-             '  Please update this call with one to:\n'
-             '  pygsti.report.create_standard_report(...)\n'))
+        _warnings.warn(_REMOVED_REPORT_FN_MSG % 'create_presentation_ppt')
 
     def create_general_report_pdf(self, confidenceLevel=None, filename="auto",
                                   title="auto", datasetLabel="auto", suffix="",
                                   tips=False, verbosity=0, comm=None,
                                   showAppendix=False):
         """ DEPRECATED: use pygsti.report.create_standard_report(...) """
-        _warnings.warn(
-            ('create_general_report_pdf(...) has been removed from pyGSTi.\n'
-             '  Starting in version 0.9.4, pyGSTi\'s PDF reports have been\n'
-             '  significantly upgraded.  As a part of this change,\n'
-             '  the functions that generate reports are now separate functions.\n'
-             '  Please update this call with one to:\n'
-             '  pygsti.report.create_standard_report(...)\n'))
+        _warnings.warn(_REMOVED_REPORT_FN_MSG % 'create_general_report_pdf')
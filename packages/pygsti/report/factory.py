@@ -1868,7 +1868,7 @@ def create_report_notebook(results, filename, title="auto",
     results_file_base = basename + '_results.pkl'
     results_file = _os.path.join(outputDir, results_file_base)
     with open(results_file, 'wb') as f:
-        _pickle.dump(results, f)
+        _pickle.dump(results, f, protocol=_pickle.HIGHEST_PROTOCOL)
 
     if title is None or title == "auto":
         autoname = _autotitle.generate_name()
@@ -9,7 +9,7 @@ from __future__ import division, print_function, absolute_import, unicode_litera
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
-import numbers as _numbers
+import numpy as _np
 from contextlib import contextmanager as _contextmanager
 import uuid as _uuid
 
@@ -21,10 +21,14 @@ import uuid as _uuid
 try: basestring
 except NameError: basestring = str
 
+#Concrete integer types, so isint(...) avoids the (slow) numbers.Integral ABC check
+try: _integer_types = (int, long, _np.integer)
+except NameError: _integer_types = (int, _np.integer)
 
-def isint(x):
+
+def isint(x, _types=_integer_types):
     """ Return whether `x` has an integer type """
-    return isinstance(x, _numbers.Integral)
+    return isinstance(x, _types)  # (_types is bound as a default to skip a global lookup per call)
 
 
 def isstr(x):
@@ -32,15 +36,6 @@ def isstr(x):
     return isinstance(x, basestring)
 
 
-def _numpy14einsumfix():
-    """ str(.) on first arg of einsum skirts a bug in Numpy 14.0 """
-    import numpy as _np
-    if _np.__version__ == '1.14.0':
-        def fixed_einsum(s, *args, **kwargs):
-            return _np.orig_einsum(str(s), *args, **kwargs)
-        _np.orig_einsum = _np.einsum
-        _np.einsum = fixed_einsum
-
 #Worse way to do this
 #import sys as _sys
 #
@@ -58,6 +53,11 @@ def _numpy14einsumfix():
 #    return isinstance(x,(str,unicodeT))
 
 
+class _dummy_SafeUUID(object):
+    def __new__(self, *args):
+        return _uuid.UUID.__new__(_uuid.UUID, *args)
+
+
 @_contextmanager
 def patched_UUID():
     """Monkeypatch the uuid module with a fake SafeUUID
@@ -67,11 +67,8 @@ def patched_UUID():
 
     TODO: objects should be serialized correctly and this should be deprecated.
     """
-    if 'SafeUUID' not in dir(_uuid):
-        class dummy_SafeUUID(object):
-            def __new__(self, *args):
-                return _uuid.UUID.__new__(_uuid.UUID, *args)
-        _uuid.SafeUUID = dummy_SafeUUID
+    if not hasattr(_uuid, 'SafeUUID'):
+        _uuid.SafeUUID = _dummy_SafeUUID
 
         yield  # context block
 
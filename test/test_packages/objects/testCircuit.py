@@ -253,7 +253,18 @@ class CircuitTestCase(BaseTestCase):
         s = c.__str__()
     
         # Check we can write to a Qcircuit file.
-        #FIX c.write_Qcircuit_tex(temp_files + '/test_qcircuit.tex')
+        c.write_Qcircuit_tex(temp_files + '/test_qcircuit.tex')
+
+        # Check the Qcircuit cells written for 1- and 2-qubit gates & idles
+        c = pygsti.obj.Circuit(layer_labels=[Label('Gh','Q0'), Label('CNOT',('Q0','Q1')),
+                                             Label('CPHASE',('Q1','Q0'))], line_labels=['Q0','Q1'])
+        c.write_Qcircuit_tex(temp_files + '/test_qcircuit.tex')
+        with open(temp_files + '/test_qcircuit.tex') as f:
+            tex = f.read()
+        self.assertTrue("\\Qcircuit @C=1.0em @R=0.5em {\n"
+                        "& \\gate{Gh} & \\ctrl{1} & \\control \\qw & \\qw & \\\\ \n"
+                        "& \\qw & \\targ & \\ctrl{-1} & \\qw & \\\\ \n"
+                        "}\\end{equation*}\n" in tex)
     
         # Test depth compression both with and without 1-qubit gate compression
         ls = [Label('H',1),Label('P',1),Label('P',1),Label(()),Label('CNOT',(2,3))]
@@ -431,6 +442,76 @@ class CircuitTestCase(BaseTestCase):
         self.assertEqual(c.num_layers(), 3)
         self.assertEqual(c.depth(), 3)
 
+    def test_copy_is_independent(self):
+        c = pygsti.obj.Circuit(None, stringrep='[Gx:0Gy:1]Gx:0', num_lines=2, editable=True, name='foo')
+        cpy = c.copy()
+        self.assertEqual(cpy, c)
+        self.assertEqual(cpy.name, 'foo')
+        cpy[0, 0] = 'Gy'
+        self.assertEqual(c[0, 0], Label('Gx', 0))
+        self.assertEqual(cpy[0, 0], Label('Gy', 0))
+
+        c.done_editing()
+        static_cpy = c.copy()
+        self.assertTrue(static_cpy.tup is c.tup)  # read-only label tuples are shared
+        editable_cpy = c.copy(editable=True)
+        editable_cpy.delete_layers(0)
+        self.assertEqual(c.num_layers(), 2)
+        self.assertEqual(editable_cpy, (('Gx', 0),))
+
+    def test_cached_depth_and_hash(self):
+        import pickle
+        c = pygsti.obj.Circuit(None, stringrep='Gi(Gx)^3', editable=True, expand_subcircuits=False)
+        self.assertEqual(c.depth(), 4)
+        c.delete_layers(0)
+        self.assertEqual(c.depth(), 3)  # editable circuits don't cache
+        c.done_editing()
+        self.assertEqual(c.depth(), 3)
+        self.assertEqual(hash(c), hash(c.tup))
+
+        c2 = pickle.loads(pickle.dumps(c))
+        self.assertTrue(c2._hash is None)  # cached hash isn't pickled
+        self.assertEqual(c2.depth(), 3)
+        self.assertEqual(hash(c2), hash(c))
+
+    def test_unpickle_circuits_after_old_object_unpickling(self):
+        import pickle
+        with pygsti.io.enable_old_object_unpickling("0.9.7"):
+            pass  # exiting must leave Circuit's own __setstate__ in place
+
+        #circuits pickled before the depth & hash were cached
+        with open(compare_files + "/repLib_dprobs%s.pkl" % self.versionsuffix, 'rb') as f:
+            dprobs = pickle.load(f)
+        for c in dprobs.keys():
+            self.assertEqual(hash(c), hash(c.tup))
+            self.assertEqual(c.depth(), len(c.tup))
+
+    def test_repeated_compress_depth(self):
+        oneQrelations = pygsti.symplectic.oneQclifford_symplectic_group_relations()
+        ls = [Label('H',1),Label('P',1),Label('P',1),Label(()),Label('CNOT',(2,3))]
+        ls += [Label('HP',1),Label('PH',1),Label('CNOT',(1,2))]
+        c = pygsti.obj.Circuit(layer_labels=ls, num_lines=4, editable=True)
+        c.compress_depth(oneQgate_relations=oneQrelations)
+        compressed = c.copy(editable=False)
+        compressed_layers = [c.get_layer(i) for i in range(c.depth())]
+
+        for rep in range(2):  # compressing an already-compressed circuit changes nothing
+            c.compress_depth(oneQgate_relations=oneQrelations)
+            self.assertEqual(c.depth(), compressed.depth())
+            self.assertEqual([c.get_layer(i) for i in range(c.depth())], compressed_layers)
+            self.assertEqual(c, compressed)
+
+        c.insert_layer([], 0)  # a mutated circuit gets recompressed
+        c.insert_layer([Label('P',1)], 0)
+        self.assertEqual(c.depth(), compressed.depth() + 2)
+        c.compress_depth(oneQgate_relations=oneQrelations)
+        self.assertTrue(c.depth() <= compressed.depth())
+        self.assertNotEqual(c, compressed)  # the extra P gate was combined, not dropped
+
+        recompressed = c.copy(editable=False)
+        c.compress_depth(oneQgate_relations=oneQrelations)
+        self.assertEqual(c, recompressed)
+
     def test_empty_tuple_makes_idle_layer(self):
         c = pygsti.obj.Circuit( ['Gi', pygsti.obj.Label(())] )
         self.assertEqual(len(c), 2)
@@ -194,6 +194,21 @@ class TestHessianMethods(BaseTestCase):
 
         self.assertWarns(cfctry.view, 0.95, 'normal', 'none') # percentage < 1.0
 
+        #Views are cached, but re-created once the Hessian, its projections or the model change
+        self.assertTrue( cfctry.view( 95.0, 'normal', 'std') is ci_std )
+        cfctry.project_hessian('std')
+        ci_std2 = cfctry.view( 95.0, 'normal', 'std')
+        self.assertFalse( ci_std2 is ci_std )
+        cfctry.compute_hessian()
+        ci_std3 = cfctry.view( 95.0, 'normal', 'std')
+        self.assertFalse( ci_std3 is ci_std2 )
+        new_model = est.models['final iteration estimate'].copy()
+        est.models['final iteration estimate'] = new_model
+        ci_std4 = cfctry.view( 95.0, 'normal', 'std')
+        self.assertFalse( ci_std4 is ci_std3 )
+        self.assertTrue( ci_std4.model is new_model )
+        self.assertTrue( cfctry.view( 95.0, 'normal', 'std') is ci_std4 )
+
         
         #Add estimate for linresponse-based CI --------------------------------------------------
         res.add_estimate(stdxyi.target_model(), stdxyi.target_model(),
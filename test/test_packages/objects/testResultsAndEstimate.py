@@ -59,6 +59,11 @@ class ResultsEstimateTestCase(BaseTestCase):
         self.assertWarns(res.add_estimate, std.target_model(), std.target_model(),
                          [model]*len(maxLengthList), parameters={'objective': 'logl'},
                          estimate_key="default") #re-init existing estimate
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            res.add_estimate(std.target_model(), std.target_model(),
+                             [model]*len(maxLengthList), parameters={'objective': 'logl'},
+                             estimate_key="default", quiet=True) #re-init w/out a warning
 
 
         est = res.estimates['default']
@@ -67,6 +72,36 @@ class ResultsEstimateTestCase(BaseTestCase):
         effds = est.get_effective_dataset()
         effds, subMxs = est.get_effective_dataset(return_subMxs=True)
 
+          #Effective dataset tracks changes to the weights (edited in place or replaced)
+        c = res.circuit_lists['final'][-1]
+        est.parameters['weights'] = {c: 0.5}
+        self.assertAlmostEqual(est.get_effective_dataset()[c].total, 0.5 * ds[c].total)
+        est.parameters['weights'][c] = 0.25
+        self.assertAlmostEqual(est.get_effective_dataset()[c].total, 0.25 * ds[c].total)
+        for w in (0.1, 0.2, 0.3, 0.2):
+            est.parameters['weights'] = {c: w}
+            self.assertAlmostEqual(est.get_effective_dataset()[c].total, w * ds[c].total)
+
+          #...and to in-place edits of a non-static data set
+        ds_nonstatic = ds.copy_nonstatic()
+        res.dataset = ds_nonstatic
+        self.assertAlmostEqual(est.get_effective_dataset()[c].total, 0.2 * ds[c].total)
+        ds_nonstatic[c].scale(3.0)
+        self.assertAlmostEqual(est.get_effective_dataset()[c].total, 0.6 * ds[c].total)
+        res.dataset = ds
+
+        del est.parameters['weights']
+        self.assertTrue(est.get_effective_dataset() is ds)
+
+          #Plaquettes (cached) follow a replaced circuit structure
+        final_gss = res.circuit_structs['final']
+        res.circuit_structs['final'] = final_gss.truncate(Ls=[1])
+        _, subMxs_truncated = est.get_effective_dataset(return_subMxs=True)
+        self.assertEqual(len(subMxs_truncated[0]), 1)  # just the L=1 column
+        res.circuit_structs['final'] = final_gss
+        _, subMxs2 = est.get_effective_dataset(return_subMxs=True)
+        self.assertEqual(len(subMxs2[0]), len(subMxs[0]))
+
           #add gauge-optimized
         goparams = {'itemWeights': {'gates': 1.0, 'spam': 0.1}, 'method': 'BFGS' } #method so we don't need a legit comm
         est.add_gaugeoptimized(goparams, label="test", comm=None, verbosity=None)
@@ -92,6 +127,13 @@ class ResultsEstimateTestCase(BaseTestCase):
         est_view = est.view(None)
         est_view = est.view(['test'])
 
+        #Estimate copies
+        est_copy = est.copy()
+        self.assertTrue(est_copy.models['test'] is est.models['test'])
+        self.assertFalse(est_copy.goparameters['test'] is est.goparameters['test'])
+        est_copy = est.copy(deep=True)
+        self.assertFalse(est_copy.models['test'] is est.models['test'])
+
         #Estimate & results render as str
         print(str(est))
         print(str(res))
@@ -100,10 +142,25 @@ class ResultsEstimateTestCase(BaseTestCase):
         s = pickle.dumps(est)
         est2 = pickle.loads(s)
 
+        #pickle Results w/out-of-band (zero-copy) buffers for the DataSet's arrays
+        if pickle.HIGHEST_PROTOCOL >= 5:
+            buffers = []
+            s = pickle.dumps(res, protocol=5, buffer_callback=buffers.append)
+            self.assertTrue(len(buffers) > 0)
+            res2 = pickle.loads(s, buffers=buffers)
+            self.assertTrue(np.array_equal(res2.dataset.oliData, res.dataset.oliData))
+
         #Results views
         rview = res.view(['default'])
         rview2 = res.view('default') # this works too
 
+        #Results copies
+        res_copy = res.copy()
+        self.assertTrue(res_copy.estimates['default'].parent is res_copy)
+        res_copy = res.copy(deep=True)
+        self.assertFalse(res_copy.estimates['default'].models['final iteration estimate'] is
+                         res.estimates['default'].models['final iteration estimate'])
+
 
         # add_estimates from other results
         res2 = pygsti.obj.Results()
@@ -144,6 +201,76 @@ class ResultsEstimateTestCase(BaseTestCase):
                                     estimate_key='Test', gauge_opt_keys="auto") # invalid "objective"
 
 
+    def test_gauge_propagation(self):
+        from pygsti.objects.estimate import _gauge_jacobian, _member_param_blocks
+
+        #prepare an estimate with a Hessian and a copy of its model transformed by a known gauge element
+        model = pygsti.io.load_model(compare_files + "/analysis.model")
+        ds = pygsti.objects.DataSet(fileToLoadFrom=compare_files + "/analysis.dataset%s" % self.versionsuffix)
+        opLabels = list(model.operations.keys())
+        gss = pygsti.construction.make_lsgst_structs(opLabels, std.fiducials, std.fiducials, std.germs, [1,2])
+
+        res = pygsti.obj.Results()
+        res.init_dataset(ds)
+        res.init_circuits(gss)
+        res.add_estimate(std.target_model(), std.target_model(), [model]*2,
+                         parameters={'objective': 'logl'}, estimate_key="default")
+        est = res.estimates['default']
+        crf = est.add_confidence_region_factory('final iteration estimate', 'final')
+        crf.compute_hessian(comm=None)
+
+        np.random.seed(1234)
+        gaugeEl = pygsti.obj.FullGaugeGroupElement(
+            pygsti.obj.FullDenseOp(np.identity(4,'d') + 0.1*np.random.randn(4,4)))
+        final_model = model.copy(); final_model.transform(gaugeEl)
+        est.add_gaugeoptimized({'model': model, '_gaugeGroupEl': gaugeEl}, model=final_model, label="T")
+
+        #Gauge Jacobian by perturbing & transforming the *entire* model, one column at a time
+        EPS = 1e-3
+        v0, w0 = model.to_vector(), final_model.to_vector()
+        TMx_chk = np.empty((len(w0), len(v0)), 'd')
+        for i in range(len(v0)):
+            mdl = model.copy(); v = v0.copy(); v[i] += EPS
+            mdl.from_vector(v); mdl.transform(gaugeEl)
+            TMx_chk[:, i] = (mdl.to_vector() - w0) / EPS
+
+        printer = pygsti.baseobjs.VerbosityPrinter(0)
+        self.assertTrue(_member_param_blocks(model) is not None) # so only owning members are transformed
+        TMx = _gauge_jacobian(model, final_model, [gaugeEl], EPS, printer)
+        self.assertArraysAlmostEqual(TMx, TMx_chk)
+
+        #Columns divided among the ranks of a (fake) 2-processor comm
+        class DummyComm(object):
+            def __init__(self, rank): self.rank = rank
+            def Get_rank(self): return self.rank
+            def Get_size(self): return 2
+            def Bcast(self, buf, root):
+                if root != self.rank: buf[...] = np.nan # mark data this rank would receive
+
+        TMx_by_rank = [_gauge_jacobian(model, final_model, [gaugeEl], EPS, printer, DummyComm(rank))
+                       for rank in (0,1)]
+        computed = [~np.isnan(T).any(axis=0) for T in TMx_by_rank]
+        self.assertTrue(np.all(computed[0] != computed[1])) # each column is computed by exactly one rank
+        for T, cols in zip(TMx_by_rank, computed):
+            self.assertArraysAlmostEqual(T[:, cols], TMx_chk[:, cols])
+
+        #Transported Hessian (computed via LU solves) vs. explicitly inverting TMx
+        new_crf = est.gauge_propagate_confidence_region_factory("T", EPS=EPS)
+        TMx_inv = np.linalg.inv(TMx_chk)
+        hessian_chk = np.dot(TMx_inv.T, np.dot(crf.hessian, TMx_inv))
+        scale = np.linalg.norm(hessian_chk)
+        self.assertArraysAlmostEqual(new_crf.hessian / scale, hessian_chk / scale)
+
+        #A non-invertible "gauge" transformation gives a singular gauge-transport matrix
+        class ProjectionGaugeGroupElement(pygsti.obj.FullGaugeGroupElement):
+            def get_transform_matrix_inverse(self): return self.get_transform_matrix()
+
+        projEl = ProjectionGaugeGroupElement(pygsti.obj.FullDenseOp(np.diag([1.,1.,1.,0.])))
+        proj_model = model.copy(); proj_model.transform(projEl)
+        est.add_gaugeoptimized({'model': model, '_gaugeGroupEl': projEl}, model=proj_model, label="P")
+        with self.assertRaises(np.linalg.LinAlgError):
+            est.gauge_propagate_confidence_region_factory("P")
+
     def test_deprecated_report_fns(self):
         #deprecated functions that issue warnings
         res = pygsti.obj.Results()
@@ -9,6 +9,7 @@ import warnings
 import pygsti
 import sys
 import os
+import math
 #import psutil
 
 temp_files    = 'temp_test_files'
@@ -63,7 +64,10 @@ class BaseTestCase(unittest.TestCase):
         os.chdir(self.old)
 
     def assertArraysAlmostEqual(self,a,b,places=7):
-        self.assertAlmostEqual( np.linalg.norm(a-b), 0, places=places )
+        # same Frobenius-norm criterion as np.linalg.norm(a-b), minus the norm(...) dispatch overhead
+        diff = a-b
+        if hasattr(diff, 'toarray'): diff = diff.toarray() # scipy sparse matrices
+        self.assertAlmostEqual( math.sqrt(np.vdot(diff,diff).real), 0, places=places )
 
     def assertArraysEqual(self,a,b,places=7):
         self.assertTrue(np.array_equal(a,b)) 